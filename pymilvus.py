@@ -1,5 +1,285 @@
 from enum import Enum
 
+# client
+def set_call_policy(**kwargs):
+    """
+    Sets the retry, rate-limiting, and concurrency policy that applies to all calls made by this client.
+
+    Only idempotent calls, such as :func:`describe_collection`, :func:`has_collection`, and :func:`list_partitions`, are retried on transient errors. Calls that change data, such as :func:`insert` and :func:`delete`, are retried only if the server reports that the request has not been applied. A retry never outlasts the :code:`timeout` of the call or the enclosing :func:`deadline`.
+
+    :param max_retries: (Optional) Specifies the maximum number of retries of a single call.
+
+        The value defaults to 3.
+    :type max_retries: int
+    :param initial_backoff: (Optional) Specifies the time to wait before the first retry in seconds. The wait doubles on each further retry, with full jitter applied.
+
+        The value defaults to 0.1.
+    :type initial_backoff: float
+    :param max_backoff: (Optional) Specifies the upper limit of the wait between two retries in seconds.
+
+        The value defaults to 10.
+    :type max_backoff: float
+    :param retry_budget: (Optional) Specifies the ratio of retries to original calls that the client allows over a sliding window of 10 seconds. Retries beyond this budget fail immediately, so that a struggling server is not flooded with retries.
+
+        The value defaults to 0.1.
+    :type retry_budget: float
+    :param rate_limits: (Optional) Specifies token-bucket rate limits per collection.
+
+        The key of each member is a collection name, or :code:`*` for all collections without their own entry. The value is a dictionary with the following members.
+
+        .. list-table::
+            :widths: 15 10 65
+            :header-rows: 1
+
+            * - Parameter
+              - Type
+              - Description
+            * - :code:`rate`
+              - `float`
+              - Specifies the number of requests allowed per second.
+            * - :code:`burst`
+              - `int`
+              - Specifies the number of requests allowed in a burst. The value defaults to :code:`rate`.
+
+        The value defaults to :code:`None`, indicating that no such limit applies.
+    :type rate_limits: dict or None
+    :param max_concurrency: (Optional) Specifies the upper limit of concurrent calls to the server.
+
+        The client starts at this limit, lowers it by half each time the server reports an overload or rate-limit error, and raises it by one for each window of calls that completes without such errors.
+
+        The value defaults to 64.
+    :type max_concurrency: int
+    :param coalesce_metadata_calls: (Optional) Specifies whether identical metadata calls made while one is in flight share its result instead of sending their own requests.
+
+        This applies to :func:`describe_collection`, :func:`describe_partition`, :func:`describe_index`, :func:`describe_alias`, :func:`has_collection`, :func:`has_partition`, :func:`has_index`, :func:`has_alias`, :func:`get_collection_statistics`, and :func:`get_partition_statistics`. Calls are identical if they have the same name and arguments. An error is raised in every call that shares it.
+
+        A call never joins an in-flight call that started before the last DDL call made through this client completed, such as :func:`create_collection`, :func:`drop_collection`, :func:`create_partition`, :func:`drop_partition`, :func:`create_index`, :func:`drop_index`, :func:`create_alias`, :func:`alter_alias`, or :func:`drop_alias`, because its result may be stale. Such a call is merged into the next identical call instead, in the same way as :func:`flush`. So a caller always sees the effect of its own DDL calls.
+
+        The value defaults to :code:`True`.
+    :type coalesce_metadata_calls: bool
+    :param metadata_batch_window: (Optional) Specifies the time in seconds during which calls of the same :code:`describe_*` or :code:`has_*` function on different targets are collected and sent as one request. This applies only if the server supports requests with multiple targets. Otherwise, each call is sent on its own.
+
+        The value defaults to 0, indicating that no calls are collected.
+    :type metadata_batch_window: float
+    :raises:
+    :returns: No returns, indicating that this operation succeeds.
+    :rtype: :code:`None`
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> pymilvus.set_call_policy(
+    ...     max_retries=5,
+    ...     rate_limits={"medium_2020_dataset": {"rate": 200, "burst": 50}},
+    ...     max_concurrency=32,
+    ...     metadata_batch_window=0.005,
+    ... )
+    """
+    pass
+
+def deadline(timeout):
+    """
+    Creates a context in which all calls share one overall deadline.
+
+    Within the context, each call and each of its retries and sub-batches receives the time left before the deadline as its timeout. A call whose own :code:`timeout` is shorter keeps its own timeout. Once the deadline passes, pending calls are cancelled and no further retries are made.
+
+    The deadline is held in a :code:`contextvars.ContextVar`, so it applies only to calls made in the current thread or asyncio task and in the contexts copied from it. Calls made by other threads or tasks, and calls made outside the context, are not affected. Nested contexts apply the earlier of the two deadlines.
+
+    :param timeout: Specifies the duration from now until the deadline in seconds.
+    :type timeout: float
+    :raises:
+    :returns: A context manager
+    :rtype: :code:`contextlib.AbstractContextManager`
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> with pymilvus.deadline(60):
+    ...     for batch in batches:
+    ...         pymilvus.insert("medium_2020_dataset", batch)
+    ...     pymilvus.flush("medium_2020_dataset")
+    """
+    pass
+
+def get_session_timestamp(collection_name):
+    """
+    Gets the latest guarantee timestamp recorded by this client for the specified collection.
+
+    The timestamp is recorded from the responses to :func:`insert`, :func:`delete`, :func:`delete_by_expr`, and :func:`flush`. Reads of the collection at the :code:`ConsistencyLevel.SESSION` level wait until the server has caught up with this timestamp, which ensures that they see all writes made through this client.
+
+    :param collection_name: Specifies the name of the collection in concern.
+
+        A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
+    :type collection_name: str
+    :raises:
+    :returns: The guarantee timestamp, or 0 if this client has not written to the collection
+    :rtype: int
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> pymilvus.delete("medium_2020_dataset", [1, 2, 3])
+    >>> pymilvus.get_session_timestamp("medium_2020_dataset")
+    443942207305596929
+    """
+    pass
+
+def set_session_timestamp(collection_name, timestamp):
+    """
+    Merges a guarantee timestamp obtained elsewhere into the one recorded by this client for the specified collection.
+
+    Use it to let a process read the writes made by another process. The recorded timestamp is replaced only if the specified one is later.
+
+    :param collection_name: Specifies the name of the collection in concern.
+
+        A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
+    :type collection_name: str
+    :param timestamp: Specifies a guarantee timestamp returned by :func:`get_session_timestamp`.
+    :type timestamp: int
+    :raises:
+    :returns: No returns, indicating that this operation succeeds.
+    :rtype: :code:`None`
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> pymilvus.set_session_timestamp("medium_2020_dataset", 443942207305596929)
+    """
+    pass
+
+def set_compression(algorithm, **kwargs):
+    """
+    Sets the compression of request bodies sent over this connection by :func:`insert`, :func:`delete`, and :func:`delete_by_expr`. Other calls, such as :func:`bulk_insert`, whose bodies hold only names and file URLs, are never compressed.
+
+    The server must be able to decode the algorithm. When connecting, the client reads the encodings that the server advertises in its :code:`grpc-accept-encoding` header. A stock gRPC server advertises only :code:`gzip` and :code:`deflate`, so :code:`zstd`, :code:`lz4`, and **shuffle** take effect only with a server that advertises them. If the server does not advertise the algorithm, or does not advertise byte shuffling while **shuffle** is :code:`True`, each request is sent uncompressed and counted under :code:`skipped_requests` in :func:`get_compression_stats`, unless **strict** is :code:`True`.
+
+    :param algorithm: Specifies the compression algorithm.
+
+        Possible values are :code:`zstd`, :code:`lz4`, :code:`gzip`, and :code:`None`, which turns compression off. Using :code:`zstd` requires the :code:`zstandard` package, and using :code:`lz4` requires the :code:`lz4` package.
+    :type algorithm: str or None
+    :param level: (Optional) Specifies the compression level. Higher levels compress better at a higher CPU cost.
+
+        The value defaults to :code:`None`, indicating that the default level of the algorithm applies.
+    :type level: int or None
+    :param min_size: (Optional) Specifies the size in bytes below which a request body is sent uncompressed.
+
+        The value defaults to 65536.
+    :type min_size: int
+    :param shuffle: (Optional) Specifies whether to byte-shuffle the columns of :code:`DataType.FLOAT_VECTOR`, :code:`DataType.FLOAT`, and :code:`DataType.DOUBLE` fields before compression, grouping the same byte of each value together. This usually improves the compression ratio of floating-point data considerably.
+
+        The server must advertise the :code:`shuffle` encoding to decode such bodies. See above.
+
+        The value defaults to :code:`True`.
+    :type shuffle: bool
+    :param strict: (Optional) Specifies whether to raise an error from this call, instead of sending requests uncompressed, if the server does not advertise the algorithm or byte shuffling.
+
+        The value defaults to :code:`False`.
+    :type strict: bool
+    :raises:
+    :returns: No returns, indicating that this operation succeeds.
+    :rtype: :code:`None`
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> pymilvus.set_compression("zstd", level=3, min_size=1024 * 1024)
+    """
+    pass
+
+def get_compression_stats():
+    """
+    Lists the compression statistics collected over this connection since :func:`set_compression` was last called.
+
+    :raises:
+    :returns: The numbers of compressed requests and of skipped requests, which were sent uncompressed because they were smaller than the :code:`min_size` passed to :func:`set_compression` or because the server does not support the compression, the bytes before and after compression, the compression ratio, and the CPU time spent on compression in seconds
+    :rtype: dict
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> stats = pymilvus.get_compression_stats()
+    >>> pymilvus.format_dict(stats)
+    {
+        'compressed_requests': 120,
+        'skipped_requests': 4,
+        'raw_bytes': 3686400000,
+        'compressed_bytes': 2654208000,
+        'ratio': 1.39,
+        'cpu_time': 18.2,
+    }
+    """
+    pass
+
+def enable_write_spool(directory, **kwargs):
+    """
+    Enables a local write-ahead spool for :func:`insert`, :func:`delete`, and :func:`delete_by_expr`.
+
+    With the spool enabled, each call encodes its request, appends it to a segment file in the spool directory, calls :code:`fsync`, and returns. A background worker sends the spooled requests to the server in the order in which they were appended, combining adjacent requests on the same collection and partition into larger batches. While the server is unavailable, requests stay in the spool and are sent once it is back. Spooled requests left by a previous process are sent when the spool is enabled again on the same directory.
+
+    Note that a call returns before its data reaches the server. With the spool enabled:
+
+    * :func:`flush` on a collection first waits until all requests on the collection spooled before the call have been sent and acknowledged, and then seals the segments, so no spooled insertion is left out of the flush.
+    * The rows and bytes counted by :func:`set_flush_policy` are counted when requests are sent, not when they are spooled, so an automatic flush never precedes the insertions that triggered it.
+    * The guarantee timestamp described in :func:`get_session_timestamp` is recorded only when a request is sent. Reads at the :code:`ConsistencyLevel.SESSION` level do not see spooled requests that have not been sent yet. To read them, call :func:`flush` on the collection first.
+
+    :param directory: Specifies the path to a local directory in which to store the spool segment files.
+    :type directory: str
+    :param segment_size: (Optional) Specifies the size in bytes at which a segment file is closed and a new one is started. A segment file is deleted once all its requests have been acknowledged.
+
+        The value defaults to 67108864.
+    :type segment_size: int
+    :param max_disk_usage: (Optional) Specifies the maximum size in bytes of all segment files. Once it is reached, calls raise an error instead of spooling.
+
+        The value defaults to :code:`None`, indicating that no such limit applies.
+    :type max_disk_usage: int or None
+    :param backpressure_threshold: (Optional) Specifies the size in bytes of unsent requests above which calls block until the spool has drained below it.
+
+        The value defaults to :code:`None`, indicating that calls never block.
+    :type backpressure_threshold: int or None
+    :param max_batch_size: (Optional) Specifies the maximum size in bytes of a combined batch sent to the server.
+
+        The value defaults to 16777216.
+    :type max_batch_size: int
+    :raises:
+    :returns: No returns, indicating that this operation succeeds.
+    :rtype: :code:`None`
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> pymilvus.enable_write_spool("/var/spool/milvus", max_disk_usage=20 * 1024 ** 3, backpressure_threshold=2 * 1024 ** 3)
+    """
+    pass
+
+def disable_write_spool(**kwargs):
+    """
+    Disables the write-ahead spool after sending all spooled requests to the server.
+
+    :param timeout: (Optional) Specifies the time to wait for the spool to drain in seconds. Requests left unsent when it expires stay in the spool directory.
+
+        The value defaults to :code:`None`, indicating that no such limit applies.
+    :type timeout: float or None
+    :raises:
+    :returns: No returns, indicating that this operation succeeds.
+    :rtype: :code:`None`
+    """
+    pass
+
+def get_write_spool_state():
+    """
+    Shows the state of the write-ahead spool.
+
+    :raises:
+    :returns: The numbers of segment files and unsent requests, the bytes on disk and unsent, and the time of the oldest unsent request
+    :rtype: dict
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> state = pymilvus.get_write_spool_state()
+    >>> pymilvus.format_dict(state)
+    {
+        'segments': 3,
+        'pending_requests': 182,
+        'disk_bytes': 201326592,
+        'pending_bytes': 150994944,
+        'oldest_pending': '2022-10-01 16:13:50',
+    }
+    """
+    pass
+
 # collection
 def create_collection(name, schema, **kwargs):
     """
@@ -71,12 +351,110 @@ def create_collection(name, schema, **kwargs):
     """
     pass
 
-def create_schema():
+def apply_schema_plan(plan, **kwargs):
+    """
+    Creates the collections, partitions, and aliases described in a declarative plan, skipping those that already exist.
+
+    The plan is compared with the current state, and only the missing items are created. Collections are created first, and then their partitions and aliases, with at most **max_concurrency** requests in flight at a time. Existing items are never changed or dropped. Items are compared as follows:
+
+    * A collection is looked up with :func:`list_collections`. If it exists, the field names returned by :func:`describe_collection` are compared with those in the planned schema, and the collection is reported as a conflict if they differ.
+    * A partition is looked up with :func:`list_partitions` on its collection.
+    * An alias is looked up with :func:`has_alias`, because :func:`list_aliases` lists only the aliases of one collection and misses an alias bound to another. If the alias exists, the collection it points to is found with :func:`describe_alias`, and the alias is reported as a conflict if it points to a collection other than the planned one. Use :func:`alter_alias` to move it.
+
+    :param plan: Specifies the items to create.
+
+        The plan is a dictionary with the following members.
+
+        .. list-table::
+            :widths: 15 10 65
+            :header-rows: 1
+
+            * - Parameter
+              - Type
+              - Description
+            * - :code:`collections`
+              - `list[dict]`
+              - Specifies the collections. Each member holds the :code:`name` and :code:`schema` of a collection and any other parameters that :func:`create_collection` accepts.
+            * - :code:`partitions`
+              - `dict`
+              - Specifies the partitions as lists of partition names keyed by collection name.
+            * - :code:`aliases`
+              - `dict`
+              - Specifies the aliases as collection names keyed by alias.
+
+    :type plan: dict
+    :param max_concurrency: (Optional) Specifies the maximum number of requests in flight at a time.
+
+        The value defaults to 16.
+    :type max_concurrency: int
+    :param timeout: (Optional) Specifies the timeout duration of this operation in seconds.
+
+        The value defaults to :code:`None`, indicating that no such limit applies.
+    :type timeout: float or None
+    :raises:
+    :returns: The result for each item in a dictionary with three members. :code:`collections` maps each collection name to its result, :code:`partitions` maps each collection name to a dictionary that maps each partition name to its result, and :code:`aliases` maps each alias to its result. A result is :code:`created`, :code:`exists` if the item exists as planned, :code:`conflict` if it exists but differs from the plan as described above, :code:`skipped` if the collection it belongs to could not be created, or the error raised in creating the item.
+    :rtype: dict
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> pymilvus.apply_schema_plan({
+    ...     "collections": [{"name": "tenant_0001_articles", "schema": schema, "num_shards": 1}],
+    ...     "partitions": {"tenant_0001_articles": ["2020_Jan", "2020_Feb"]},
+    ...     "aliases": {"tenant_0001": "tenant_0001_articles"},
+    ... })
+    {
+        'collections': {'tenant_0001_articles': 'created'},
+        'partitions': {'tenant_0001_articles': {'2020_Jan': 'created', '2020_Feb': 'created'}},
+        'aliases': {'tenant_0001': 'conflict'},
+    }
+    """
+    pass
+
+def create_schema(**kwargs):
     """
-    Creates an empty :class:`CollectionSchema` object.
+    Creates an empty :class:`CollectionSchema` object, or one whose fields are inferred from a data frame.
+
+    :param data: (Optional) Specifies a data frame from which the fields are inferred.
+
+        Each column becomes a field of the same name. The data type of each field is inferred from the dtype of the column as listed in the following table.
+
+        .. list-table::
+            :widths: 30 30 40
+            :header-rows: 1
 
+            * - pandas dtype
+              - Polars dtype
+              - Field data type
+            * - :code:`bool`, :code:`boolean`
+              - :code:`Boolean`
+              - :code:`DataType.BOOL`
+            * - :code:`int8`, :code:`int16`, :code:`int32`, :code:`int64`, and their nullable forms :code:`Int8`, :code:`Int16`, :code:`Int32`, :code:`Int64`
+              - :code:`Int8`, :code:`Int16`, :code:`Int32`, :code:`Int64`
+              - :code:`DataType.INT8`, :code:`DataType.INT16`, :code:`DataType.INT32`, :code:`DataType.INT64`
+            * - :code:`float32`, :code:`float64`, :code:`Float32`, :code:`Float64`
+              - :code:`Float32`, :code:`Float64`
+              - :code:`DataType.FLOAT`, :code:`DataType.DOUBLE`
+            * - :code:`object` or :code:`string` holding strings
+              - :code:`Utf8` or :code:`String`
+              - :code:`DataType.VARCHAR`, with :code:`max_length` set as described in **max_length**
+            * - :code:`object` holding lists or arrays of floats
+              - :code:`List(Float32)`, :code:`List(Float64)`, :code:`Array(Float32, dim)`, or :code:`Array(Float64, dim)`
+              - :code:`DataType.FLOAT_VECTOR`, with :code:`dim` taken from the :code:`Array` dtype or else from the length of the first value in the column
+
+        Columns of any other dtype, such as unsigned integers, dates and datetimes, and pandas :code:`category` or Polars :code:`Categorical` and :code:`Enum` columns, raise a :code:`ValueError` that names the column. So does any column that contains nulls, because fields cannot hold them. Convert, fill, or drop such columns before calling this function.
+
+        The value defaults to :code:`None`, indicating that an empty schema is created.
+    :type data: pandas.DataFrame or polars.DataFrame or None
+    :param max_length: (Optional) Specifies the :code:`max_length` of the inferred :code:`DataType.VARCHAR` fields, either as one value for all of them or as values keyed by column name.
+
+        The value defaults to :code:`None`, indicating that twice the length of the longest value in the column applies, up to 65535, so that later insertions of somewhat longer strings still fit.
+    :type max_length: int or dict[str, int] or None
+    :param primary_field: (Optional) Specifies the name of the primary field when **data** is provided.
+
+        The value defaults to :code:`None`, indicating that the first integer column is used.
+    :type primary_field: str or None
     :raises:
-    :returns: An empty **CollectionSchema** object
+    :returns: A **CollectionSchema** object
     :rtype: :class:`CollectionSchema`
 
     >>> import pymilvus
@@ -91,6 +469,10 @@ def create_schema():
     ...           .add_field("publication", DataType.STRING, max_length=512, description="article category")
     ...           .add_field("claps", DataType.INT64, description="number of claps received")
     ...           .add_field("responses", DataType.INT64, description="number of comments received")
+    >>>
+    >>> import pandas as pd
+    >>> df = pd.read_parquet("medium_2020_dataset.parquet")
+    >>> schema = pymilvus.create_schema(data=df, primary_field="id", max_length={"title": 512, "link": 1024})
     """
     pass
 
@@ -98,6 +480,8 @@ def describe_collection(name, **kwargs):
     """
     Describes the detail of a collection.
 
+    Identical concurrent calls may share one request. See the **coalesce_metadata_calls** parameter of :func:`set_call_policy`.
+
     :param name: Specifies the name of the collection in concern.
 
         A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
@@ -157,6 +541,201 @@ def load_collection(name, **kwargs):
     """
     pass
 
+def load_collections(collections, **kwargs):
+    """
+    Loads multiple collections concurrently, for example, after a cluster restart.
+
+    Collections are loaded in order of priority and then of size, with the smaller collections first. Sizes are taken from the row counts returned by :func:`get_collection_statistics`. At most **max_concurrency** collections are loaded at a time, and the progress of all loads is polled together in one request per interval where the server supports progress requests for multiple collections. Otherwise, the progress of each collection being loaded is polled with one request per collection per interval.
+
+    :param collections: Specifies the collections to load.
+
+        Each member is either a collection name or a dictionary with the following members.
+
+        .. list-table::
+            :widths: 15 10 65
+            :header-rows: 1
+
+            * - Parameter
+              - Type
+              - Description
+            * - :code:`name`
+              - `str`
+              - Specifies the name of the collection.
+            * - :code:`num_replicas`
+              - `int`
+              - Specifies the number of replicas to load. The value defaults to 1.
+            * - :code:`priority`
+              - `int`
+              - Specifies the priority of the collection. Collections with larger values are loaded first. The value defaults to 0.
+
+    :type collections: list[str or dict]
+    :param max_concurrency: (Optional) Specifies the maximum number of collections being loaded at a time.
+
+        The value defaults to 8.
+    :type max_concurrency: int
+    :param max_loading_rows: (Optional) Specifies the maximum number of rows being loaded at a time across all collections, so that query nodes are not overwhelmed. A collection larger than this limit is loaded alone.
+
+        The value defaults to :code:`None`, indicating that no such limit applies.
+    :type max_loading_rows: int or None
+    :param poll_interval: (Optional) Specifies the interval between two progress polls in seconds.
+
+        The value defaults to 1.
+    :type poll_interval: float
+    :param timeout: (Optional) Specifies the timeout duration of this operation in seconds.
+
+        The value defaults to :code:`None`, indicating that no such limit applies.
+    :type timeout: float or None
+    :raises:
+    :returns: A task that loads all specified collections. Its progress includes the number of loaded collections and rows and the estimated time to completion in seconds.
+    :rtype: :class:`Task`
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> task = pymilvus.load_collections([
+    ...     {"name": "medium_2020_dataset", "num_replicas": 3, "priority": 1},
+    ...     "articles",
+    ... ], max_concurrency=16)
+    >>> pymilvus.format_dict(task.get_progress())
+    {
+        'loaded_collections': 1,
+        'total_collections': 2,
+        'loaded_rows': 5979,
+        'total_rows': 23916,
+        'eta': 42.5,
+    }
+    >>> task.wait()
+    """
+    pass
+
+def migrate_collection(source, target, **kwargs):
+    """
+    Copies all entities from one collection to another while the source stays in service, and then switches an alias to the target.
+
+    The migration runs in the following steps:
+
+    1. Creates the target collection with **schema** and **num_shards**, unless it exists.
+    2. Reads the source as of the time the task starts with several parallel readers, each reading one partition or one primary-key range, and passes each batch through **transform**.
+    3. Inserts the batches into the target with several writers, so that reading and writing overlap.
+    4. Builds the indexes in **index_plan** with :func:`apply_index_plan` and loads the target with :func:`load_collection`.
+    5. Deletes from the target again the entities deleted from the source through this client since the task started, and points **alias** at the target with :func:`alter_alias`.
+
+    The source stays in service for reads throughout. Writes are handled as follows:
+
+    * Calls of :func:`insert`, :func:`delete`, and :func:`delete_by_expr` on the source made through this client after the task starts are applied to both collections, with **transform** applied to inserted batches. This covers writes made while :func:`alter_alias` is in progress, so no write through this client is lost during the cutover.
+    * Writes made by other clients or processes cannot be captured, because the API offers no feed of changes and no way to list deleted entities. Pause such writers from the time the task starts until it completes, or send their writes through the client running the migration.
+
+    :param source: Specifies the name of the source collection.
+
+        A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
+    :type source: str
+    :param target: Specifies the name of the target collection.
+
+        A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
+    :type target: str
+    :param schema: (Optional) Specifies the schema of the target collection if it is to be created.
+
+        The value defaults to :code:`None`, indicating that the schema of the source applies.
+    :type schema: :class:`CollectionSchema` or None
+    :param num_shards: (Optional) Specifies the number of shards in the target collection if it is to be created.
+
+        The value defaults to :code:`None`, indicating that the number of shards in the source applies.
+    :type num_shards: int or None
+    :param transform: (Optional) Specifies a function applied to each batch before it is inserted, for example, to compute new embeddings or to convert vectors to :code:`DataType.FLOAT16_VECTOR`. The function takes and returns a :code:`pyarrow.RecordBatch`.
+
+        The value defaults to :code:`None`, indicating that batches are inserted as read.
+    :type transform: callable or None
+    :param index_plan: (Optional) Specifies the indexes to build on the target in the same form that :func:`apply_index_plan` accepts, without :code:`collection_name`.
+
+        The value defaults to :code:`None`, indicating that each index of the source is built again on the target with the index name, index type, and metric type returned by :func:`describe_index` and the default build parameters of the index type. Because :func:`describe_index` does not return build parameters such as :code:`nlist`, specify the plan to keep them.
+    :type index_plan: list[dict] or None
+    :param alias: (Optional) Specifies the alias to point at the target once the copy completes.
+
+        The value defaults to :code:`None`, indicating that no alias is changed.
+    :type alias: str or None
+    :param num_readers: (Optional) Specifies the number of parallel readers.
+
+        The value defaults to 4.
+    :type num_readers: int
+    :param num_writers: (Optional) Specifies the number of parallel writers.
+
+        The value defaults to 4.
+    :type num_writers: int
+    :param batch_size: (Optional) Specifies the number of rows in each batch.
+
+        The value defaults to 10000.
+    :type batch_size: int
+    :param timeout: (Optional) Specifies the timeout duration of this operation in seconds.
+
+        The value defaults to :code:`None`, indicating that no such limit applies.
+    :type timeout: float or None
+    :raises:
+    :returns: A collection-migrating task. Its progress includes the current step, the numbers of rows read and written, the throughput in rows per second, and the lag of the target behind the source in rows.
+    :rtype: :class:`Task`
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> task = pymilvus.migrate_collection(
+    ...     "medium_2020_dataset", "medium_2020_dataset_v2",
+    ...     num_shards=4,
+    ...     alias="articles",
+    ...     num_readers=8,
+    ...     num_writers=8,
+    ... )
+    >>> task.wait()
+    """
+    pass
+
+def create_local_replica(collection_name, field_name, **kwargs):
+    """
+    Copies the vectors of a small collection into client memory as a :class:`LocalReplica` object that answers top-k searches on the local CPU.
+
+    The entities are read page by page into one contiguous :code:`float32` matrix, together with their primary keys and the requested output fields. The replica applies the insertions and deletions made through this client as they happen. Because the API offers no way to list the changes made by others, the replica picks them up by reading the collection again in full at each **sync_interval**. Searches use **metric_type** or, if it is omitted, the metric type of the index on the field, returned by :func:`describe_index`.
+
+    Use it only for collections that fit in memory, such as those with fewer than 100,000 vectors.
+
+    :param collection_name: Specifies the name of the collection in concern.
+
+        A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
+    :type collection_name: str
+    :param field_name: Specifies the name of the :code:`DataType.FLOAT_VECTOR` field to search.
+
+        A field name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
+    :type field_name: str
+    :param metric_type: (Optional) Specifies the metric type used to measure vector similarities. Possible values are :code:`L2` and :code:`IP`.
+
+        The value defaults to :code:`None`, indicating that the metric type of the index on the field applies.
+    :type metric_type: str or None
+    :param partition_names: (Optional) Specifies the names of the partitions to copy.
+
+        The value defaults to :code:`None`, indicating that all partitions are copied.
+    :type partition_names: list[str] or None
+    :param output_fields: (Optional) Specifies the scalar fields to copy and return with search results.
+
+        The value defaults to :code:`None`, indicating that only primary keys are returned.
+    :type output_fields: list[str] or None
+    :param sync_interval: (Optional) Specifies the interval between two syncs with the server in seconds. Each sync reads the whole collection or the specified partitions again.
+
+        The value defaults to 60.
+    :type sync_interval: float
+    :param max_rows: (Optional) Specifies the maximum number of rows the replica may hold. Creating the replica fails if the collection holds more.
+
+        The value defaults to 1000000.
+    :type max_rows: int
+    :param timeout: (Optional) Specifies the timeout duration of this operation in seconds.
+
+        The value defaults to :code:`None`, indicating that no such limit applies.
+    :type timeout: float or None
+    :raises ValueError: If **metric_type** is omitted and the field has no index, or if the collection holds more than **max_rows** rows.
+    :returns: A local replica
+    :rtype: :class:`LocalReplica`
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> replica = pymilvus.create_local_replica("medium_2020_dataset", "title_vector", output_fields=["title"])
+    >>> distances, ids = replica.search(query_vectors, top_k=10)
+    """
+    pass
+
 def release_collection(name, **kwargs):
     """
     Releases the loaded collection from memory. All data in the released collection remains intact after this operation. You can load the collection to memory again using :func:`load_collection`. 
@@ -206,6 +785,8 @@ def get_collection_statistics(name, **kwargs):
     """
     Lists the statistical items of a collection.
 
+    Identical concurrent calls may share one request. See the **coalesce_metadata_calls** parameter of :func:`set_call_policy`.
+
     :param name: Specifies the name of the collection in concern.
 
         A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
@@ -239,6 +820,38 @@ def get_collection_statistics(name, **kwargs):
     """
     pass
 
+def get_statistics_snapshot(collection_names=None, **kwargs):
+    """
+    Collects the statistics of multiple collections and their partitions into a :class:`StatisticsSnapshot` object.
+
+    The statistics are fetched with :func:`get_collection_statistics` and :func:`get_partition_statistics`, with at most **max_concurrency** requests in flight at a time, and stored in columns with one row per partition.
+
+    :param collection_names: (Optional) Specifies the names of the collections in concern.
+
+        The value defaults to :code:`None`, indicating that all collections returned by :func:`list_collections` apply.
+    :type collection_names: list[str] or None
+    :param max_concurrency: (Optional) Specifies the maximum number of requests in flight at a time.
+
+        The value defaults to 16.
+    :type max_concurrency: int
+    :param timeout: (Optional) Specifies the timeout duration of this operation in seconds.
+
+        The value defaults to :code:`None`, indicating that no such limit applies.
+    :type timeout: float or None
+    :raises:
+    :returns: A statistics snapshot
+    :rtype: :class:`StatisticsSnapshot`
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> snapshot = pymilvus.get_statistics_snapshot()
+    >>> snapshot.aggregate("collection_name", "row_count")
+    {'articles': 17937, 'medium_2020_dataset': 5979}
+    >>> snapshot.refresh()
+    1
+    """
+    pass
+
 def list_collections(**kwargs):
     """
     Lists all collection names in the database.
@@ -262,6 +875,8 @@ def has_collection(name, **kwargs):
     """
     Shows whether a collection after the specified name exists.
 
+    Identical concurrent calls may share one request. See the **coalesce_metadata_calls** parameter of :func:`set_call_policy`.
+
     :param name: Specifies the name of the collection in concern.
 
         A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
@@ -383,6 +998,8 @@ def describe_alias(alias, **kwargs):
     """
     Describes a specified alias.
 
+    Identical concurrent calls may share one request. See the **coalesce_metadata_calls** parameter of :func:`set_call_policy`.
+
     :param alias: Specifies an alias desired for the collection.
 
         A collection alias should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
@@ -401,6 +1018,8 @@ def has_alias(alias, **kwargs):
     """
     Checks whether the specified alias exists.
 
+    Identical concurrent calls may share one request. See the **coalesce_metadata_calls** parameter of :func:`set_call_policy`.
+
     :param alias: Specifies an alias desired for the collection.
 
         A collection alias should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
@@ -473,10 +1092,136 @@ def create_index(collection_name, field_name, index_name, index_params, **kwargs
     """
     pass
 
+def apply_index_plan(plan, **kwargs):
+    """
+    Builds the indexes described in a declarative plan across collections and fields, skipping those that already exist as specified.
+
+    Each index in the plan is looked up by name with :func:`list_indexes`. An index that does not exist is created. For an index that exists, the index type and metric type returned by :func:`describe_index` are compared with those in the plan. Build parameters, such as :code:`nlist`, are not compared, because :func:`describe_index` does not return them. An index whose type or metric type differs is reported as a mismatch and left as it is, unless **rebuild** is :code:`True`. Each collection with an index to build is flushed with :func:`flush` before the build starts, so that the index covers all sealed segments.
+
+    :param plan: Specifies the indexes to build.
+
+        Each member is a dictionary with the following members.
+
+        .. list-table::
+            :widths: 15 10 65
+            :header-rows: 1
+
+            * - Parameter
+              - Type
+              - Description
+            * - :code:`collection_name`
+              - `str`
+              - Specifies the name of the collection.
+            * - :code:`field_name`
+              - `str`
+              - Specifies the name of the field to index.
+            * - :code:`index_name`
+              - `str`
+              - Specifies the name of the index.
+            * - :code:`index_params`
+              - `dict`
+              - Specifies the index parameters in the same form that :func:`create_index` accepts.
+
+    :type plan: list[dict]
+    :param max_concurrency: (Optional) Specifies the maximum number of indexes being built at a time.
+
+        The value defaults to 4.
+    :type max_concurrency: int
+    :param rebuild: (Optional) Specifies whether to drop and create again each index whose type or metric type differs from the plan. Note that searches on the field fail between dropping the index and loading the new one.
+
+        The value defaults to :code:`False`, indicating that such indexes are reported as mismatches and left unchanged.
+    :type rebuild: bool
+    :param dry_run: (Optional) Specifies whether to only compute the changes without applying them.
+
+        The value defaults to :code:`False`.
+    :type dry_run: bool
+    :param timeout: (Optional) Specifies the timeout duration of this operation in seconds.
+
+        The value defaults to :code:`None`, indicating that no such limit applies.
+    :type timeout: float or None
+    :raises:
+    :returns: A task that builds all changed indexes. Its progress lists each index in the plan with its action, which is one of :code:`create`, :code:`rebuild`, :code:`mismatch`, and :code:`unchanged`, and its build state.
+    :rtype: :class:`Task`
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>>
+    >>> index_params = {
+    ...     "index_type": "HNSW",
+    ...     "metric_type": "IP",
+    ...     "params": { "M": 16, "efConstruction": 200 }
+    ... }
+    ...
+    >>> task = pymilvus.apply_index_plan([
+    ...     {"collection_name": "medium_2020_dataset", "field_name": "title_vector", "index_name": "title_vector_index", "index_params": index_params},
+    ...     {"collection_name": "articles", "field_name": "title_vector", "index_name": "title_vector_index", "index_params": index_params},
+    ... ], max_concurrency=2)
+    >>> task.wait()
+    """
+    pass
+
+def recommend_index_params(collection_name, field_name, vectors, metric_type, **kwargs):
+    """
+    Recommends index parameters for a vector field by benchmarking candidate settings on a sample of its vectors.
+
+    The row count of the collection, returned by :func:`get_collection_statistics`, and the :code:`dim` of the field in the schema determine the candidate settings, such as the :code:`nlist` values of :code:`IVF_FLAT` and :code:`IVF_SQ8` and the :code:`M` and :code:`efConstruction` values of :code:`HNSW`. Each candidate is built on the sample on the local CPU, and its recall is measured against exact brute-force results computed with NumPy. The cheapest candidate that reaches the target recall is returned, where cost is estimated as query latency scaled to the row count of the collection, then memory.
+
+    Because the sample is much smaller than the collection, IVF candidates are scaled to it so that each list holds as many sample vectors as it would hold collection vectors. A candidate with :code:`nlist` lists for a collection of :code:`N` rows is built on a sample of :code:`n` vectors with :code:`nlist * n / N` lists, rounded and at least 1. The number of lists to probe is searched on the sample, and the :code:`nprobe` returned is the fraction of lists probed on the sample, :code:`nprobe / nlist`, applied to the full :code:`nlist`. HNSW candidates are built on the sample with their parameters unchanged, because :code:`M` and :code:`ef` do not depend on the row count, and the measured recall is therefore an upper bound for larger collections. If the sample holds fewer than 39 vectors per list of the scaled candidate, the candidate is skipped, because k-means on so few points does not reflect the real lists.
+
+    :param collection_name: Specifies the name of the target collection.
+
+        A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
+    :type collection_name: str
+    :param field_name: Specifies the name of the vector field to index.
+
+        A field name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
+    :type field_name: str
+    :param vectors: Specifies a sample of the vectors in the field, as a two-dimensional :code:`float32` array whose second dimension equals :code:`dim`. A sample of 10,000 to 100,000 vectors is usually enough.
+    :type vectors: numpy.ndarray
+    :param metric_type: Specifies the metric type used to measure vector similarities. For details, see `Similarity Metrics <https://milvus.io/docs/metric.md>`_.
+    :type metric_type: str
+    :param target_recall: (Optional) Specifies the minimum recall of the top-k results.
+
+        The value defaults to 0.95.
+    :type target_recall: float
+    :param top_k: (Optional) Specifies the number of results per query used to measure recall.
+
+        The value defaults to 10.
+    :type top_k: int
+    :param index_types: (Optional) Specifies the index types to consider.
+
+        The value defaults to :code:`["IVF_FLAT", "IVF_SQ8", "HNSW"]`.
+    :type index_types: list[str]
+    :raises:
+    :returns: A tuple of two dictionaries. The first holds the index parameters in the same form that :func:`create_index` accepts. The second is the benchmark report, which holds the search parameters that reach the target recall, such as :code:`nprobe` or :code:`ef`, in :code:`search_params`, and the measured :code:`recall`, :code:`latency` in seconds per query, and :code:`memory` in bytes estimated for the collection.
+    :rtype: tuple[dict, dict]
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> index_params, report = pymilvus.recommend_index_params("medium_2020_dataset", "title_vector", sample, "IP")
+    >>> pymilvus.format_dict(index_params)
+    {
+        'index_type': 'IVF_FLAT',
+        'metric_type': 'IP',
+        'params': { 'nlist': 128 },
+    }
+    >>> pymilvus.format_dict(report)
+    {
+        'search_params': { 'nprobe': 12 },
+        'recall': 0.957,
+        'latency': 0.00042,
+        'memory': 18808536,
+    }
+    >>> pymilvus.create_index("medium_2020_dataset", "title_vector", "title_vector_index", index_params)
+    """
+    pass
+
 def describe_index(collection_name, index_name, **kwargs):
     """
     Describes the index of a collection.
 
+    Identical concurrent calls may share one request. See the **coalesce_metadata_calls** parameter of :func:`set_call_policy`.
+
     :param collection_name: Specifies a collection desired for the collection.
 
         A collection collection should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
@@ -534,6 +1279,8 @@ def has_index(collection_name, index_name, **kwargs):
     """
     Shows whether the specified index exists in the collection.
 
+    Identical concurrent calls may share one request. See the **coalesce_metadata_calls** parameter of :func:`set_call_policy`.
+
     :param collection_name: Specifies a collection desired for the collection.
 
         A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
@@ -602,10 +1349,45 @@ def create_partition(collection_name, partition_name, **kwargs):
     """
     pass
 
+def create_partitions(collection_name, partition_names, **kwargs):
+    """
+    Creates multiple partitions in a collection, skipping those that already exist.
+
+    The existing partitions are found with one call of :func:`list_partitions`, and only the missing partitions are created, with at most **max_concurrency** requests in flight at a time.
+
+    :param collection_name: Specifies the name of the target collection.
+
+        A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
+    :type collection_name: str
+    :param partition_names: Specifies the names of the partitions to create.
+
+        A partition name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
+    :type partition_names: list[str]
+    :param max_concurrency: (Optional) Specifies the maximum number of requests in flight at a time.
+
+        The value defaults to 16.
+    :type max_concurrency: int
+    :param timeout: (Optional) Specifies the timeout duration of this operation in seconds.
+
+        The value defaults to :code:`None`, indicating that no such limit applies.
+    :type timeout: float or None
+    :raises:
+    :returns: The result for each partition, keyed by partition name. A result is :code:`created`, :code:`exists`, or the error raised in creating the partition.
+    :rtype: dict
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> pymilvus.create_partitions("medium_2020_dataset", ["tenant_0001", "tenant_0002", "active_partition"])
+    {'tenant_0001': 'created', 'tenant_0002': 'created', 'active_partition': 'exists'}
+    """
+    pass
+
 def describe_partition(collection_name, partition_name, **kwargs):
     """
     Describes a partition of a collection.
 
+    Identical concurrent calls may share one request. See the **coalesce_metadata_calls** parameter of :func:`set_call_policy`.
+
     :param collection_name: Specifies the name of the target collection.
 
         A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
@@ -723,6 +1505,8 @@ def get_partition_statistics(collection_name, partition_names, **kwargs):
     """
     Lists all statistical items of specified partition names.
 
+    Identical concurrent calls may share one request. See the **coalesce_metadata_calls** parameter of :func:`set_call_policy`.
+
     :param collection_name: Specifies the name of the target collection.
 
         A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
@@ -774,6 +1558,8 @@ def has_partition(collection_name, partition_name, **kwargs):
     """
     Shows whether a partition after the specified name exists in a collection.
 
+    Identical concurrent calls may share one request. See the **coalesce_metadata_calls** parameter of :func:`set_call_policy`.
+
     :param collection_name: Specifies the name of the target collection.
 
         A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
@@ -797,10 +1583,57 @@ def has_partition(collection_name, partition_name, **kwargs):
     """
     pass
 
+def create_partition_cache(collection_name, memory_budget, **kwargs):
+    """
+    Creates a :class:`PartitionCache` object that keeps the most used partitions of a collection loaded within a memory budget.
+
+    The memory that a partition takes is estimated from its row count, returned by :func:`get_partition_statistics`, and the :code:`dim` of the vector fields in the schema. When loading a partition would exceed the budget, the least valuable loaded partitions are released first. A partition is never released while it is pinned or held by a lease returned by :meth:`PartitionCache.acquire`. Loads and releases requested at the same time are sent together as concurrent tasks, and concurrent requests for the same unloaded partition share one load.
+
+    :param collection_name: Specifies the name of the target collection.
+
+        A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
+    :type collection_name: str
+    :param memory_budget: Specifies the memory in bytes that the loaded partitions of the collection may take.
+    :type memory_budget: int
+    :param eviction_policy: (Optional) Specifies how to choose the partitions to release.
+
+        Possible values are :code:`LRU`, which releases the least recently used partitions, and :code:`LFU`, which releases the least frequently used partitions.
+
+        The value defaults to :code:`LRU`.
+    :type eviction_policy: str
+    :param prefetch: (Optional) Specifies the number of partitions to load ahead of use, chosen from those that have most often been used right after the partitions in use.
+
+        The value defaults to 0, indicating that no partition is loaded ahead of use.
+    :type prefetch: int
+    :param pinned_partitions: (Optional) Specifies the partitions that are never released.
+
+        The value defaults to :code:`None`, indicating that no such partition applies.
+    :type pinned_partitions: list[str] or None
+    :param num_replicas: (Optional) Specifies the number of replicas to load.
+
+        The value defaults to 1, indicating that only one replica is loaded.
+    :type num_replicas: int
+    :raises:
+    :returns: A partition cache
+    :rtype: :class:`PartitionCache`
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> cache = pymilvus.create_partition_cache("articles", 8 * 1024 ** 3, eviction_policy="LFU", prefetch=1)
+    >>> with cache.acquire(["2020_Jan", "2020_Feb"]):
+    ...     cache.get_resident_partitions()
+    ...     # query the partitions here; they cannot be evicted until the block exits
+    ...
+    ['2020_Jan', '2020_Feb']
+    """
+    pass
+
 def insert(collection_name, **kwargs):
     """
     Inserts a data record into the specified collection as an entity.
 
+    The guarantee timestamp returned by the server is recorded for the collection. See :func:`get_session_timestamp`.
+
     :param collection_name: Specifies the name of the target collection.
 
         A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
@@ -889,32 +1722,236 @@ def insert(collection_name, **kwargs):
                     18,
                     3
                 ]
-            ]                       
-    :type data: list[any]
+            ]
+
+        * Or a :code:`pyarrow.Table` or :code:`pyarrow.RecordBatch`, each column of which corresponds to a field of the same name.
+
+        Columns of an Arrow table are mapped to the schema without being converted to Python objects. A fixed-size-list column of :code:`float32` values whose list size equals :code:`dim` maps to a :code:`DataType.FLOAT_VECTOR` field, and its buffer is serialized as is.
+
+        .. code-block:: python
+
+            import pyarrow as pa
+
+            data = pa.table({
+                "id": pa.array([0, 1], type=pa.int64()),
+                "title_vector": pa.FixedSizeListArray.from_arrays(
+                    pa.array(vectors.ravel(), type=pa.float32()), 768
+                ),
+                ...
+            })
+
+        * Or a :code:`pandas.DataFrame` or :code:`polars.DataFrame`, each column of which corresponds to a field of the same name.
+
+        Columns are matched to fields by the field names in the :class:`CollectionSchema` of the collection, and columns that match no field are ignored. A vector column can hold lists or NumPy arrays and is converted to a single contiguous :code:`float32` block in one step rather than row by row.
+
+        .. code-block:: python
+
+            import pandas as pd
+
+            data = pd.DataFrame({
+                "id": [0, 1],
+                "title_vector": list(vectors),
+                ...
+            })
+
+        A value of a :code:`DataType.FLOAT16_VECTOR` or :code:`DataType.BFLOAT16_VECTOR` field can be a list, a NumPy array of the matching dtype, or a :code:`float32` NumPy array. A two-dimensional :code:`float32` array for a whole column is converted in one step without a per-row loop.
+
+        A value of a :code:`DataType.INT8_VECTOR` field should be a list or NumPy array of :code:`int8` values. It can be a :code:`float32` NumPy array only if **quantization_scales** specifies a scale for the field.
+    :type data: list[any] or pyarrow.Table or pyarrow.RecordBatch or pandas.DataFrame or polars.DataFrame
+    :param quantization_scales: (Optional) Specifies the scales used to quantize :code:`float32` values of :code:`DataType.INT8_VECTOR` fields, keyed by field name.
+
+        Each component is multiplied by the scale of its field, rounded to the nearest integer, and clipped to the range from -128 to 127. The same scale applies to every vector in the field, so distances between quantized vectors stay comparable. Use the same scale for all insertions into a field and for the query vectors searched against it.
+
+        The value defaults to :code:`None`, indicating that :code:`float32` values are rejected for :code:`DataType.INT8_VECTOR` fields with a :code:`ValueError`.
+    :type quantization_scales: dict[str, float] or None
+    :param normalize: (Optional) Specifies whether to L2-normalize the values of :code:`DataType.FLOAT_VECTOR` fields before they are sent.
+
+        Possible values are :code:`True`, which normalizes all vector fields, :code:`False`, which normalizes none, and :code:`auto`, which normalizes only the fields whose index uses the :code:`IP` metric type according to :func:`describe_index`. Vectors provided as :code:`float32` NumPy arrays are normalized in place, so the caller's arrays change and no copy is made.
+
+        The value defaults to :code:`False`.
+    :type normalize: bool or str
+    :param check_zero_norm: (Optional) Specifies whether to raise an error instead of inserting when a vector to normalize has a zero norm.
+
+        The value defaults to :code:`False`, indicating that zero vectors are inserted unchanged.
+    :type check_zero_norm: bool
     :param partition_name: (Optional) Specifies the name of the target collection.
 
         A partition name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_). The default value is :code:`None`.
-    :type partition_name: str or None  
-    :param timeout: (Optional) Specifies the timeout duration of this operation in seconds.
+    :type partition_name: str or None  
+    :param timeout: (Optional) Specifies the timeout duration of this operation in seconds.
+
+        The value defaults to :code:`None`, indicating that no such limit applies.
+    :type timeout: float or None
+    :raises:
+    :returns: No returns, indicating that this operation succeeds.
+    :rtype: :code:`None`
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> pymilvus.insert("medium_2020_dataset", [
+    ...     0, 
+    ...     "The Reported Mortality Rate of Coronavirus Is Not Important", 
+    ...     [0.041732933, 0.013779674, -0.027564144, -0.013061441], 
+    ...     "https://medium.com/swlh/the-reported-mortality-rate-of-coronavirus-is-not-important-369989c8d912", 
+    ...     13, 
+    ...     "The Startup", 
+    ...     1100, 
+    ...     18      
+    ... ])    
+    """
+    pass
+
+def insert_from_files(collection_name, files, **kwargs):
+    """
+    Inserts entities from local vector and column files into the specified collection, one batch at a time.
+
+    The files are memory-mapped rather than read into memory. Each batch is a window of rows over the mapped pages and is serialized into the request buffer directly from them, so the memory in use stays close to the size of one batch no matter how large the files are.
+
+    :param collection_name: Specifies the name of the target collection.
+
+        A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
+    :type collection_name: str
+    :param files: Specifies a mapping from field names to local file paths.
+
+        Each field in the schema, except an auto-generated primary field, should map to one file. All files should hold the same number of rows. The following file formats apply.
+
+        .. list-table::
+            :widths: 20 80
+            :header-rows: 1
+
+            * - Format
+              - Description
+            * - :code:`.npy`
+              - A NumPy array file. A vector field requires a two-dimensional array whose second dimension equals :code:`dim`. The array should be of :code:`float32` for a :code:`DataType.FLOAT_VECTOR` field, of :code:`float16` or :code:`float32` for a :code:`DataType.FLOAT16_VECTOR` field, of :code:`int8` for a :code:`DataType.INT8_VECTOR` field, and of :code:`float32` or of :code:`uint16` holding the raw bits for a :code:`DataType.BFLOAT16_VECTOR` field. A scalar field requires a one-dimensional array of a matching dtype.
+            * - :code:`.fvecs`
+              - A file in which each vector is stored as a 4-byte little-endian dimension followed by that number of :code:`float32` components. Applies only to :code:`DataType.FLOAT_VECTOR` fields, whose components are sent as they are, and to :code:`DataType.FLOAT16_VECTOR` and :code:`DataType.BFLOAT16_VECTOR` fields, whose components are converted batch by batch. A :code:`DataType.INT8_VECTOR` field requires an :code:`.npy` file of quantized :code:`int8` values.
+            * - :code:`.bvecs`
+              - A file in which each vector is stored as a 4-byte little-endian dimension followed by that number of bytes. Applies only to :code:`DataType.BINARY_VECTOR` fields. Each byte holds 8 packed bits, so the :code:`dim` of the field should be 8 times the dimension stored in the file. The bytes are sent as they are, without conversion. To insert :code:`uint8` feature vectors into a :code:`DataType.FLOAT_VECTOR` field, convert them to a :code:`float32` :code:`.npy` file first.
+
+    :type files: dict[str, str]
+    :param batch_size: (Optional) Specifies the number of rows in each insert request.
+
+        The value defaults to 10000.
+    :type batch_size: int
+    :param start_offset: (Optional) Specifies the row offset in the files from which the insertion starts. Use it to resume an insertion that has stopped halfway.
+
+        The value defaults to 0, indicating that the insertion starts from the first row.
+    :type start_offset: int
+    :param partition_name: (Optional) Specifies the name of the target partition.
+
+        A partition name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_). The default value is :code:`None`.
+    :type partition_name: str or None
+    :param timeout: (Optional) Specifies the timeout duration of each insert request in seconds.
+
+        The value defaults to :code:`None`, indicating that no such limit applies.
+    :type timeout: float or None
+    :raises:
+    :returns: An entity-inserting task. Its progress is the number of rows inserted so far, counted from the first row in the files.
+    :rtype: :class:`Task`
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> task = pymilvus.insert_from_files("medium_2020_dataset", {
+    ...     "id": "ids.npy",
+    ...     "title_vector": "title_vectors.fvecs",
+    ...     "reading_time": "reading_times.npy",
+    ... }, batch_size=20000)
+    >>> task.wait()
+    >>>
+    >>> # resume from the 5,000,000th row after an interruption
+    >>> task = pymilvus.insert_from_files("medium_2020_dataset", files, start_offset=5000000)
+    """
+    pass
+
+def parallel_insert(collection_name, data, **kwargs):
+    """
+    Inserts a large batch of entities using several worker processes, so that encoding the requests is not limited to one CPU core.
+
+    The data is split into column blocks of **batch_size** rows. The blocks are placed in shared memory with :code:`multiprocessing.shared_memory` and handed to the workers by name and offset, so vectors are never pickled or copied between processes. Each worker encodes its blocks according to the :class:`CollectionSchema` of the collection and sends them over its own connection.
+
+    Workers do not inherit the connection made with :func:`connect`, because they may be started with the :code:`spawn` method. Instead, the parameters of the connection are passed to each worker when it starts, and the worker connects with them. See **connection**.
+
+    :param collection_name: Specifies the name of the target collection.
+
+        A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
+    :type collection_name: str
+    :param data: Specifies the entities to insert as columns in any form that :func:`insert` accepts.
+
+        Vector columns are copied into shared memory once, in the parent process. A two-dimensional NumPy array or an Arrow fixed-size-list column of the field's dtype is copied as is. A vector column in any other form, such as a list or a DataFrame column of arrays, is first converted to a contiguous block in the parent, as :func:`insert` would convert it, which takes one extra copy.
+    :type data: list[any] or pyarrow.Table or pyarrow.RecordBatch or pandas.DataFrame or polars.DataFrame
+    :param connection: (Optional) Specifies the parameters with which each worker connects, such as :code:`host` and :code:`port`, in the same form as the keyword arguments of :func:`connect`.
+
+        The value defaults to :code:`None`, indicating that the parameters of the current connection of this process apply.
+    :type connection: dict or None
+    :param num_workers: (Optional) Specifies the number of worker processes.
+
+        The value defaults to :code:`None`, indicating that one worker is started per CPU core.
+    :type num_workers: int or None
+    :param batch_size: (Optional) Specifies the number of rows in each insert request.
+
+        The value defaults to 10000.
+    :type batch_size: int
+    :param partition_name: (Optional) Specifies the name of the target partition.
+
+        A partition name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_). The default value is :code:`None`.
+    :type partition_name: str or None
+    :param timeout: (Optional) Specifies the timeout duration of each insert request in seconds.
 
         The value defaults to :code:`None`, indicating that no such limit applies.
     :type timeout: float or None
     :raises:
-    :returns: No returns, indicating that this operation succeeds.
-    :rtype: :code:`None`
+    :returns: A report of the insertion, which lists the numbers of inserted and failed rows, the elapsed time, the throughput in rows per second, and the source offset range and error of each failed batch.
+    :rtype: dict
 
     >>> import pymilvus
     >>> pymilvus.connect(ip_addr, port)
-    >>> pymilvus.insert("medium_2020_dataset", [
-    ...     0, 
-    ...     "The Reported Mortality Rate of Coronavirus Is Not Important", 
-    ...     [0.041732933, 0.013779674, -0.027564144, -0.013061441], 
-    ...     "https://medium.com/swlh/the-reported-mortality-rate-of-coronavirus-is-not-important-369989c8d912", 
-    ...     13, 
-    ...     "The Startup", 
-    ...     1100, 
-    ...     18      
-    ... ])    
+    >>> report = pymilvus.parallel_insert("medium_2020_dataset", [ids, titles, title_vectors], num_workers=16)
+    >>> pymilvus.format_dict(report)
+    {
+        'inserted_rows': 10000000,
+        'failed_rows': 0,
+        'elapsed': 41.7,
+        'throughput': 239808,
+        'errors': [],
+    }
+    """
+    pass
+
+def create_ingest_session(collection_name, checkpoint_file, **kwargs):
+    """
+    Creates an :class:`IngestSession` object that records every acknowledged insert batch in a local checkpoint file.
+
+    If the checkpoint file already exists, the session resumes from it, and the rows recorded in it are skipped when they are inserted again.
+
+    :param collection_name: Specifies the name of the target collection.
+
+        A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
+    :type collection_name: str
+    :param checkpoint_file: Specifies the path to a local checkpoint file.
+
+        When the file is created, a header holding a random session ID, the collection name, and the partition name is written as its first line. If the file already exists and its header names another collection or partition, a :code:`ValueError` is raised, so that a checkpoint is never applied to the wrong target. Each acknowledged batch is then appended to the file as one line holding its source offset range and the range of primary keys it has been assigned. The file is flushed to disk before the batch is reported as completed.
+    :type checkpoint_file: str
+    :param idempotent: (Optional) Specifies whether to tag each batch with an idempotency token derived from the session ID in the checkpoint file, the collection name, and the source offset range of the batch.
+
+        Because the session ID is kept in the checkpoint file, a resumed session produces the same tokens as the one it resumes, while two sessions with different checkpoint files never share tokens, even if they write to the same collection from the same offsets. If the server supports idempotency tokens, a replayed batch is acknowledged without being inserted again. Otherwise, the tokens are ignored and only the checkpoint file prevents replays.
+
+        The value defaults to :code:`True`.
+    :type idempotent: bool
+    :param partition_name: (Optional) Specifies the name of the target partition.
+
+        A partition name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_). The default value is :code:`None`.
+    :type partition_name: str or None
+    :raises ValueError: If the checkpoint file was created for another collection or partition.
+    :returns: An ingest session
+    :rtype: :class:`IngestSession`
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> session = pymilvus.create_ingest_session("medium_2020_dataset", "medium_2020_dataset.ckpt")
+    >>> for offset in range(0, len(rows), 10000):
+    ...     session.insert(rows[offset:offset + 10000], source_offset=offset)
+    ...
+    >>> session.close()
     """
     pass
 
@@ -960,7 +1997,11 @@ def bulk_insert(collection_name, file, **kwargs):
                     }
                 ]
             }
-    :type files: list[str] 
+
+        A valid file can also be a Parquet file whose column names match the field names in the schema. A :code:`DataType.FLOAT_VECTOR` field should be stored as a fixed-size-list or list column of :code:`float32` values. Parquet files are read one row group at a time, so a file is never held in memory as a whole.
+
+        In either format, a :code:`DataType.FLOAT16_VECTOR` or :code:`DataType.BFLOAT16_VECTOR` field can hold :code:`float32` values, which are converted to the field type when imported. A :code:`DataType.INT8_VECTOR` field should hold integers from -128 to 127 that have already been quantized. A Parquet file can also store these fields as fixed-size-list columns of :code:`float16` or :code:`int8` values, or as fixed-size binary columns holding the encoded components, to halve or quarter the file size.
+    :type files: list[str]
     :param partition_name: (Optional) Specifies the name of the target partition. If omitted, an arbitrary partition is selected.
 
         A partition name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_). The default value is :code:`None`.
@@ -975,7 +2016,9 @@ def bulk_insert(collection_name, file, **kwargs):
 
     >>> import pymilvus
     >>> task = pymilvus.bulk_insert("medium_2020_dataset", "medium_2020_dataset.json")
-    >>> task.wait()   
+    >>> task.wait()
+    >>> task = pymilvus.bulk_insert("medium_2020_dataset", "medium_2020_dataset.parquet")
+    >>> task.wait()
     """
     pass
 
@@ -1034,10 +2077,92 @@ def get_bulk_insert_state(task_id, **kwargs):
     """
     pass
 
+def export_collection(collection_name, directory, **kwargs):
+    """
+    Exports the entities in a collection to local Parquet files in the layout that :func:`bulk_insert` accepts.
+
+    The collection is read in parallel by several workers, each reading one partition or one primary-key range within a partition, and each worker writes its own files. The files of each partition are written to a subdirectory named after the partition, as :code:`<directory>/<partition_name>/part-<worker>-<sequence>.parquet`, so every file holds entities of one partition only. The progress of each worker is saved as :code:`checkpoint.json` after each file is written.
+
+    The details returned by :func:`describe_collection` are saved as :code:`schema.json` in the same directory, together with the name, data type, and parameters of each field, such as :code:`dim`, :code:`max_length`, and :code:`auto_id`, and the names of the exported partitions in :code:`partitions`. No function reads this file back. To restore the collection, create it from the fields in :code:`schema.json` with :func:`create_schema` and :func:`create_collection`, create its partitions with :func:`create_partitions`, upload the Parquet files to the S3-like block storage that the server reads from, and import each file with :func:`bulk_insert` into the partition named by its subdirectory.
+
+    :param collection_name: Specifies the name of the collection in concern.
+
+        A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
+    :type collection_name: str
+    :param directory: Specifies the path to a local directory in which to write the files.
+    :type directory: str
+    :param partition_names: (Optional) Specifies the names of the partitions to export.
+
+        The value defaults to :code:`None`, indicating that all partitions are exported.
+    :type partition_names: list[str] or None
+    :param include_primary_key: (Optional) Specifies whether to write the primary-key column to the files.
+
+        An :code:`auto_id` collection rejects imported files that provide primary keys, so the column is left out by default for such a collection, and the entities get new primary keys when they are restored. To keep the keys, set this to :code:`True` and restore into a collection whose primary field has :code:`auto_id` set to :code:`False`.
+
+        The value defaults to :code:`None`, indicating that the column is written unless the primary field of the collection has :code:`auto_id` set to :code:`True`.
+    :type include_primary_key: bool or None
+    :param num_workers: (Optional) Specifies the number of workers reading the collection at a time.
+
+        The value defaults to 4.
+    :type num_workers: int
+    :param rows_per_file: (Optional) Specifies the number of rows in each Parquet file. Keep the files within the size limit of :func:`bulk_insert`.
+
+        The value defaults to 1000000.
+    :type rows_per_file: int
+    :param resume: (Optional) Specifies whether to continue from the checkpoint in the directory instead of starting over.
+
+        The value defaults to :code:`True`.
+    :type resume: bool
+    :param timeout: (Optional) Specifies the timeout duration of this operation in seconds.
+
+        The value defaults to :code:`None`, indicating that no such limit applies.
+    :type timeout: float or None
+    :raises:
+    :returns: An entity-exporting task. Its progress includes the numbers of exported rows and files and the throughput in rows per second.
+    :rtype: :class:`Task`
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> task = pymilvus.export_collection("medium_2020_dataset", "/backup/medium_2020_dataset", num_workers=8)
+    >>> task.wait()
+    >>>
+    >>> # restore the backup to another collection
+    >>> import glob, json, os
+    >>> with open("/backup/medium_2020_dataset/schema.json") as f:
+    ...     backup = json.load(f)
+    ...
+    >>> schema = pymilvus.create_schema()
+    >>> for field in backup["fields"]:
+    ...     schema.add_field(field["name"], pymilvus.DataType[field["data_type"]], **field["params"])
+    ...
+    >>> pymilvus.create_collection("medium_2020_dataset_restored", schema)
+    >>> pymilvus.create_partitions("medium_2020_dataset_restored", backup["partitions"])
+    >>>
+    >>> # after uploading the directory to s3://backup/medium_2020_dataset/
+    >>> tasks = [
+    ...     pymilvus.bulk_insert(
+    ...         "medium_2020_dataset_restored",
+    ...         "s3://backup/medium_2020_dataset/" + os.path.relpath(path, "/backup/medium_2020_dataset"),
+    ...         partition_name=partition,
+    ...     )
+    ...     for partition in backup["partitions"]
+    ...     for path in sorted(glob.glob(os.path.join("/backup/medium_2020_dataset", partition, "*.parquet")))
+    ... ]
+    >>> for task in tasks:
+    ...     task.wait()
+    """
+    pass
+
 def flush(collection_name, **kwargs):
     """
     Seals all entities in the specified collection. Any insertion after a flush operation results in generating new segments. Note that only sealed segments can be indexed.
 
+    At most one flush request per collection is in flight at a time. Calls made while a flush of the collection is in progress are merged into one next flush, which starts once the current one completes, and they all return when it does. To seal segments by size or time instead of after each batch, use :func:`set_flush_policy`.
+
+    If the write spool is enabled with :func:`enable_write_spool`, the requests on the collection spooled before the call are sent before the segments are sealed.
+
+    The guarantee timestamp returned by the server is recorded for the collection. See :func:`get_session_timestamp`.
+
     :param collection_name: Specifies the name of the collection in concern.
 
         A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
@@ -1066,10 +2191,71 @@ def flush(collection_name, **kwargs):
     """
     pass
 
+def set_flush_policy(collection_name, **kwargs):
+    """
+    Sets the policy by which the client flushes the specified collection automatically after insertions.
+
+    The client counts the rows and bytes inserted into the collection since the last flush and calls :func:`flush` once any of the limits below is reached. Explicit flush calls reset the counters.
+
+    :param collection_name: Specifies the name of the collection in concern.
+
+        A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
+    :type collection_name: str
+    :param max_rows: (Optional) Specifies the number of rows inserted since the last flush that triggers a flush.
+
+        The value defaults to :code:`None`, indicating that no such limit applies.
+    :type max_rows: int or None
+    :param max_bytes: (Optional) Specifies the size in bytes of the data inserted since the last flush that triggers a flush.
+
+        The value defaults to :code:`None`, indicating that no such limit applies.
+    :type max_bytes: int or None
+    :param interval: (Optional) Specifies the time in seconds after the first unflushed insertion that triggers a flush.
+
+        The value defaults to :code:`None`, indicating that no such limit applies.
+    :type interval: float or None
+    :raises:
+    :returns: No returns, indicating that this operation succeeds.
+    :rtype: :code:`None`
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> pymilvus.set_flush_policy("medium_2020_dataset", max_rows=1000000, interval=60)
+    """
+    pass
+
+def get_flush_metrics(collection_name, **kwargs):
+    """
+    Lists the flush metrics collected by this client for the specified collection.
+
+    :param collection_name: Specifies the name of the collection in concern.
+
+        A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
+    :type collection_name: str
+    :raises:
+    :returns: All flush metrics of the collection
+    :rtype: dict
+
+    >>> import pymilvus
+    >>> pymilvus.connect(ip_addr, port)
+    >>> metrics = pymilvus.get_flush_metrics("medium_2020_dataset")
+    >>> pymilvus.format_dict(metrics)
+    {
+        'flush_requests': 1200,
+        'flush_calls': 38,
+        'sealed_segments': 41,
+        'rows_per_flush': 26315,
+        'latency_p50': 0.84,
+        'latency_p99': 2.31,
+    }
+    """
+    pass
+
 def delete_by_expr(collection_name, **kwargs):
     """
     Deletes entities that match the specified expression from a collection.
 
+    The guarantee timestamp returned by the server is recorded for the collection. See :func:`get_session_timestamp`.
+
     :param collection_name: Specifies the name of the collection in concern.
 
         A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
@@ -1096,6 +2282,8 @@ def delete(collection_name, primary_keys, partition_names=None, **kwargs):
     """
     Deletes specified entities from a collection.
 
+    The guarantee timestamp returned by the server is recorded for the collection. See :func:`get_session_timestamp`.
+
     :param collection_name: Specifies the name of the collection in concern.
 
         A collection name should be a string of 1 to 255 characters, starting with a letter or an underscore (_) and containing only numbers, letters, and underscores (_).
@@ -1118,6 +2306,86 @@ def delete(collection_name, primary_keys, partition_names=None, **kwargs):
     """
     pass
 
+# utility
+def normalize_vectors(vectors, **kwargs):
+    """
+    L2-normalizes vectors in place so that the :code:`IP` metric type measures cosine similarity.
+
+    The norms of all rows are computed and applied in one vectorized step on the array itself, without making a copy.
+
+    :param vectors: Specifies the vectors as a two-dimensional :code:`float32` array, in which each row is a vector.
+    :type vectors: numpy.ndarray
+    :param check_zero_norm: (Optional) Specifies whether to raise an error when a vector has a zero norm.
+
+        The value defaults to :code:`False`, indicating that zero vectors are left unchanged.
+    :type check_zero_norm: bool
+    :raises ValueError: If the array is not a two-dimensional :code:`float32` array, or if **check_zero_norm** is :code:`True` and a vector has a zero norm.
+    :returns: The same array, normalized
+    :rtype: numpy.ndarray
+
+    >>> import pymilvus
+    >>> vectors = model.encode(titles).astype("float32")
+    >>> pymilvus.normalize_vectors(vectors, check_zero_norm=True)
+    >>> pymilvus.insert("medium_2020_dataset", [ids, titles, vectors])
+    """
+    pass
+
+def pack_binary_vectors(bits):
+    """
+    Packs bit vectors into the byte format of :code:`DataType.BINARY_VECTOR` values.
+
+    The bits of each row are packed 8 to a byte, with the first bit in the most significant position, using NumPy bit operations over the whole matrix at once.
+
+    :param bits: Specifies the bit vectors as a two-dimensional array of :code:`bool` or :code:`uint8` values, in which each row is a vector and any non-zero value is a set bit.
+
+        The number of columns is the :code:`dim` of the field and should be a multiple of 8.
+    :type bits: numpy.ndarray
+    :raises ValueError: If the array is not two-dimensional or its number of columns is not a multiple of 8.
+    :returns: A :code:`uint8` array of shape :code:`(rows, dim // 8)`, which can be used as the column of a :code:`DataType.BINARY_VECTOR` field in :func:`insert`.
+    :rtype: numpy.ndarray
+
+    >>> import numpy as np
+    >>> import pymilvus
+    >>> bits = np.random.rand(1000000, 256) > 0.5
+    >>> packed = pymilvus.pack_binary_vectors(bits)
+    >>> packed.shape
+    (1000000, 32)
+    """
+    pass
+
+def binary_top_k(queries, vectors, top_k, **kwargs):
+    """
+    Finds the nearest packed binary vectors to each query on the local CPU.
+
+    Distances are computed with vectorized XOR and population counts over the packed bytes, so no vector is unpacked. Use it to filter out near-duplicates before insertion.
+
+    :param queries: Specifies the query vectors as a :code:`uint8` array of shape :code:`(num_queries, dim // 8)`, such as one returned by :func:`pack_binary_vectors`.
+    :type queries: numpy.ndarray
+    :param vectors: Specifies the vectors to search as a :code:`uint8` array of shape :code:`(num_vectors, dim // 8)`.
+    :type vectors: numpy.ndarray
+    :param top_k: Specifies the number of nearest vectors to return for each query.
+    :type top_k: int
+    :param metric_type: (Optional) Specifies the distance to use. Possible values are :code:`HAMMING` and :code:`JACCARD`.
+
+        The value defaults to :code:`HAMMING`.
+    :type metric_type: str
+    :param batch_size: (Optional) Specifies the number of queries compared with all vectors at a time, which bounds the memory used by intermediate results.
+
+        The value defaults to 1024.
+    :type batch_size: int
+    :raises ValueError: If the queries and the vectors differ in the number of bytes per vector.
+    :returns: A tuple of two arrays of shape :code:`(num_queries, top_k)`, holding the distances in ascending order and the row indexes of the matching vectors.
+    :rtype: tuple[numpy.ndarray, numpy.ndarray]
+
+    >>> import pymilvus
+    >>> import numpy as np
+    >>> # each query is also in packed, so ask for one more result and drop its match with itself
+    >>> distances, indexes = pymilvus.binary_top_k(packed[:10], packed, top_k=6)
+    >>> is_self = indexes == np.arange(10)[:, None]
+    >>> duplicates = indexes[~is_self & (distances <= 3)]
+    """
+    pass
+
 class CollectionSchema:
 
     def add_field(name, data_type, **kwargs):
@@ -1141,9 +2409,223 @@ class Task:
         """
         pass
 
+class IngestSession:
+
+    def insert(data, source_offset, **kwargs):
+        """
+        Inserts the rows of a batch that the checkpoint file does not show as acknowledged.
+
+        A batch may overlap the recorded ranges only in part, for example, when the batch size has changed on restart. In that case, only the rows outside the recorded ranges are inserted, as one or more sub-batches, and each sub-batch is recorded as its own range. No row is inserted twice or left out.
+
+        :param data: Specifies the batch to insert. It takes any form that :func:`insert` accepts.
+        :type data: list[any] or pyarrow.Table or pyarrow.RecordBatch or pandas.DataFrame or polars.DataFrame
+        :param source_offset: Specifies the offset of the first row of the batch in the source data.
+        :type source_offset: int
+        :param timeout: (Optional) Specifies the timeout duration of this operation in seconds.
+
+            The value defaults to :code:`None`, indicating that no such limit applies.
+        :type timeout: float or None
+        :raises:
+        :returns: The number of rows inserted in this call. :code:`0` indicates that the whole batch has been skipped as completed.
+        :rtype: int
+        """
+        pass
+
+    def is_completed(source_offset, num_rows):
+        """
+        Checks whether all rows in the specified source offset range have been acknowledged.
+
+        :param source_offset: Specifies the offset of the first row in the range.
+        :type source_offset: int
+        :param num_rows: Specifies the number of rows in the range.
+        :type num_rows: int
+        :returns: A boolean value indicating whether the range has been completed.
+        :rtype: bool
+        """
+        pass
+
+    def get_completed_ranges():
+        """
+        Lists the acknowledged batches recorded in the checkpoint file.
+
+        :returns: A list of dictionaries, each of which holds the :code:`source_offset`, :code:`num_rows`, and :code:`primary_keys` range of an acknowledged batch, ordered by source offset.
+        :rtype: list[dict]
+        """
+        pass
+
+    def close():
+        """
+        Flushes the checkpoint file and closes the session.
+        """
+        pass
+
+class PartitionCache:
+
+    def acquire(partition_names, **kwargs):
+        """
+        Ensures that the specified partitions are loaded and holds a lease on them, loading those that are not and releasing others as the memory budget requires.
+
+        Each partition keeps a count of the leases held on it, and only partitions with no lease and no pin can be released. A lease is returned when the context of the returned object exits. So a call in one thread never releases partitions that another thread is still using.
+
+        If the partitions to load do not fit in the budget because other partitions are leased, the call waits until enough leases are returned. If the specified partitions and the pinned partitions together exceed the budget, they can never fit, and a :code:`ValueError` is raised at once. The budget is never exceeded.
+
+        :param partition_names: Specifies the names of the partitions to use.
+        :type partition_names: list[str]
+        :param timeout: (Optional) Specifies the timeout duration of this operation in seconds, including any wait for leases to be returned.
+
+            The value defaults to :code:`None`, indicating that no such limit applies.
+        :type timeout: float or None
+        :raises ValueError: If the specified partitions and the pinned partitions together exceed the memory budget.
+        :returns: A lease on the partitions, to be used in a :code:`with` statement
+        :rtype: :code:`contextlib.AbstractContextManager`
+        """
+        pass
+
+    def release(partition_names, **kwargs):
+        """
+        Releases the specified partitions from memory regardless of the eviction policy.
+
+        Partitions that are pinned or held by a lease are skipped.
+
+        :param partition_names: Specifies the names of the partitions to release.
+        :type partition_names: list[str]
+        :param timeout: (Optional) Specifies the timeout duration of this operation in seconds.
+
+            The value defaults to :code:`None`, indicating that no such limit applies.
+        :type timeout: float or None
+        :raises:
+        :returns: No returns, indicating that this operation succeeds.
+        :rtype: :code:`None`
+        """
+        pass
+
+    def get_resident_partitions():
+        """
+        Lists the partitions that are loaded or being loaded by this cache.
+
+        :returns: A list of partition names, from the most to the least valuable according to the eviction policy.
+        :rtype: list[str]
+        """
+        pass
+
+    def get_usage():
+        """
+        Shows the estimated memory taken by the loaded partitions.
+
+        :returns: A dictionary with :code:`memory_budget`, :code:`memory_used`, and the estimated bytes and the number of leases of each loaded partition in :code:`partitions`.
+        :rtype: dict
+        """
+        pass
+
+class StatisticsSnapshot:
+
+    def refresh(**kwargs):
+        """
+        Fetches the statistics again for the partitions that may have changed since the snapshot was taken or last refreshed.
+
+        A partition may have changed if this client has inserted into, deleted from, or flushed its collection since then. Partitions created or dropped since then are added or removed.
+
+        :param force: (Optional) Specifies whether to fetch the statistics of all partitions again.
+
+            The value defaults to :code:`False`.
+        :type force: bool
+        :param timeout: (Optional) Specifies the timeout duration of this operation in seconds.
+
+            The value defaults to :code:`None`, indicating that no such limit applies.
+        :type timeout: float or None
+        :raises:
+        :returns: The number of partitions whose statistics have been fetched again
+        :rtype: int
+        """
+        pass
+
+    def to_numpy():
+        """
+        Returns the statistics as NumPy arrays, one row per partition.
+
+        The columns are :code:`collection_name`, :code:`partition_name`, :code:`row_count`, :code:`num_shards`, :code:`estimated_bytes`, and :code:`updated_at`. The :code:`estimated_bytes` column is computed from the row count and the data types of the fields in the schema.
+
+        :returns: The columns, keyed by column name
+        :rtype: dict[str, numpy.ndarray]
+        """
+        pass
+
+    def to_arrow():
+        """
+        Returns the statistics as a :code:`pyarrow.Table` with the same columns as :meth:`to_numpy`.
+
+        :returns: The statistics table
+        :rtype: pyarrow.Table
+        """
+        pass
+
+    def aggregate(group_by, column, **kwargs):
+        """
+        Aggregates a column of the statistics locally, without calling the server.
+
+        :param group_by: Specifies how to group the rows. Possible values are :code:`collection_name`, which groups the rows by collection, and :code:`partition_name`, which groups them by partition. Because partition names such as :code:`_default` repeat across collections, partitions are grouped by collection name and partition name together.
+        :type group_by: str
+        :param column: Specifies the column to aggregate, such as :code:`row_count` or :code:`estimated_bytes`.
+        :type column: str
+        :param per_shard: (Optional) Specifies whether to divide each result by the number of shards in the collection.
+
+            The value defaults to :code:`False`.
+        :type per_shard: bool
+        :param func: (Optional) Specifies the aggregate function. Possible values are :code:`sum`, :code:`mean`, :code:`min`, and :code:`max`.
+
+            The value defaults to :code:`sum`.
+        :type func: str
+        :returns: The aggregated values, keyed by collection name, or by a tuple of collection name and partition name when grouped by partition
+        :rtype: dict
+        """
+        pass
+
+class LocalReplica:
+
+    def search(vectors, top_k, **kwargs):
+        """
+        Finds the nearest vectors in the replica to each query vector.
+
+        All query vectors are compared with all vectors in the replica using one batched matrix multiplication with NumPy, and no request is sent to the server.
+
+        :param vectors: Specifies the query vectors as a two-dimensional :code:`float32` array, in which each row is a vector.
+        :type vectors: numpy.ndarray
+        :param top_k: Specifies the number of nearest vectors to return for each query.
+        :type top_k: int
+        :param partition_names: (Optional) Specifies the names of the partitions to search.
+
+            The value defaults to :code:`None`, indicating that all copied partitions are searched.
+        :type partition_names: list[str] or None
+        :returns: A tuple of two arrays of shape :code:`(num_queries, top_k)`, holding the distances of the matching entities, from the nearest to the farthest, and their primary keys. The order is the same as that of :func:`binary_top_k`. If :code:`output_fields` was specified when the replica was created, a third member holds the values of these fields in the same layout, keyed by field name.
+        :rtype: tuple
+        """
+        pass
+
+    def sync(**kwargs):
+        """
+        Reads the collection or the specified partitions again in full, page by page, and replaces the copy held by the replica once the read completes. Searches use the previous copy until then.
+
+        :param timeout: (Optional) Specifies the timeout duration of this operation in seconds.
+
+            The value defaults to :code:`None`, indicating that no such limit applies.
+        :type timeout: float or None
+        :raises:
+        :returns: No returns, indicating that this operation succeeds.
+        :rtype: :code:`None`
+        """
+        pass
+
+    def close():
+        """
+        Stops syncing and frees the memory held by the replica.
+        """
+        pass
+
 class ConsistencyLevel(Enum):
     """
     Enumerates all consistency levels of a collection. For details, see `Consistency Level <https://milvus.io/docs/consistency.md#Consistency-levels>`_.
+
+    With :code:`SESSION`, a read waits only until the data written through this client is visible. The client records the guarantee timestamp returned by :func:`insert`, :func:`delete`, :func:`delete_by_expr`, and :func:`flush` for each collection and attaches it to later reads of the collection. To share the timestamp with other processes, use :func:`get_session_timestamp` and :func:`set_session_timestamp`.
     """
     STRONG = 1
     SESSION = 2
@@ -1153,6 +2635,10 @@ class ConsistencyLevel(Enum):
 class DataType(Enum):
     """
     Enumerates all applicable data types in Milvus.
+
+    :code:`FLOAT16_VECTOR` and :code:`BFLOAT16_VECTOR` store each component in 2 bytes, and :code:`INT8_VECTOR` stores each component in 1 byte. Vectors of the first two types can be provided as :code:`float32` NumPy arrays, which the client converts in one vectorized step before sending. Vectors of :code:`INT8_VECTOR` should be quantized by the caller, or provided as :code:`float32` NumPy arrays together with a fixed scale for the field. See the **quantization_scales** parameter of :func:`insert`.
+
+    A :code:`BINARY_VECTOR` value is a vector of bits packed 8 to a byte, so its :code:`dim` should be a multiple of 8. To pack a matrix of bits, use :func:`pack_binary_vectors`.
     """
     BOOL = 1
     INT8 = 2
@@ -1163,4 +2649,7 @@ class DataType(Enum):
     DOUBLE = 7
     VARCHAR = 8
     BINARY_VECTOR = 9
-    FLOAT_VECTOR = 10    
+    FLOAT_VECTOR = 10
+    FLOAT16_VECTOR = 11
+    BFLOAT16_VECTOR = 12
+    INT8_VECTOR = 13